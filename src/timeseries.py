@@ -1,8 +1,85 @@
+import concurrent.futures
+import logging
+import os
+import warnings
+from typing import Dict, List, Tuple
+
+import numpy as np
 import pandas as pd
+from statsmodels.tsa.adfvalues import mackinnonp
 from statsmodels.tsa.stattools import adfuller, kpss
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+logger = logging.getLogger(__name__)
+
+_LONG_SERIES_SIZE = 100000
+
+_DESIGN_CACHE: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def _get_design(n: int, lags: int) -> np.ndarray:
+    """
+    Return a preallocated design matrix buffer for a series of length "n"
+    and a fixed lag length, so repeated tests on same-shaped windows fill
+    the buffer in place instead of allocating a new one per call.
+    """
+    key = (n, lags)
+    design = _DESIGN_CACHE.get(key)
+    if design is None:
+        design = _DESIGN_CACHE[key] = np.empty((n - 1 - lags, lags + 2))
+
+    return design
+
+
+def _adfuller_statistic(
+        values: np.ndarray, lags: int, design: np.ndarray) -> float:
+    """
+    Compute the Augmented Dickey-Fuller test statistic with a fixed lag
+    length by solving the normal equations of the lag-augmented regression
+    directly, skipping the statsmodels per-call overhead. The design matrix
+    buffer is filled in place.
+    """
+    n = values.shape[0]
+    n_obs = n - 1 - lags
+    diff = values[1:] - values[:-1]
+
+    for lag in range(lags):
+        design[:, lag] = diff[lags - 1 - lag:n - 2 - lag]
+    design[:, lags] = values[lags:n - 1]
+    design[:, lags + 1] = 1.0
+    target = diff[lags:]
+
+    gram = design.T @ design
+    beta = np.linalg.solve(gram, design.T @ target)
+    residuals = target - design @ beta
+    sigma2 = residuals @ residuals / (n_obs - (lags + 2))
+    covariance = sigma2 * np.linalg.inv(gram)
+
+    return beta[lags] / np.sqrt(covariance[lags, lags])
+
+
+if numba is not None:
+    _adfuller_statistic = numba.njit(
+        cache=True, fastmath=True)(_adfuller_statistic)
+
+
+def _to_1d_array(timeseries) -> np.ndarray:
+    """
+    Convert a timeseries dataframe or series into a contiguous 1-D float64
+    array, so statsmodels does not have to reshape and copy it internally.
+    """
+    return np.ascontiguousarray(
+        np.asarray(timeseries).ravel(), dtype=np.float64)
+
 
-def run_adfuller_test(timeseries: pd.DataFrame, auto_lag: str = "AIC") -> bool:
+def run_adfuller_test(
+        timeseries: pd.DataFrame, lags: int = None,
+        auto_lag: str = "AIC", fast: bool = False,
+        verbose: bool = False) -> bool:
     """
     Given a timeseries dataframe, this function runs Augmented Dickey-Fuller
     test to determines if timeseries is stationary or non-stationary.
@@ -10,10 +87,23 @@ def run_adfuller_test(timeseries: pd.DataFrame, auto_lag: str = "AIC") -> bool:
     Args:
         timeseries (pd.DataFrame): dataframe with timeseries data to check if
             it is stationary or not.
+        lags (optional, int): fixed lag length to use. When it is set, the
+            test runs a single regression with "maxlag" equal to this value
+            instead of searching over all lag lengths, which is much faster
+            on long timeseries. Default value is None.
         auto_lag (str): "autolag" param from statsmodels.tsa.stattools.adfuller
             function. This param refers to which method to use for automatic
             automatically determining the lag length among the values.
-            Default value is "AIC".
+            It is only used when "lags" is None. Default value is "AIC".
+        fast (optional, bool): if True and "lags" is set, compute the test
+            statistic with a numba-compiled regression instead of going
+            through statsmodels, which is much faster on long timeseries.
+            It requires numba; without it the statsmodels path is used.
+            The critical values table is not reported on this path.
+            Default value is False.
+        verbose (optional, bool): if True, log the test results. Logging is
+            off by default so the test stays quiet when it is called over
+            many series. Default value is False.
 
     Notes:
         Timeseries is stationary if Augmented Dickey-Fuller test reject the
@@ -24,33 +114,108 @@ def run_adfuller_test(timeseries: pd.DataFrame, auto_lag: str = "AIC") -> bool:
         True if timeseries is stationary, otherwise False.
 
     """
-    print('Results of Augmented Dickey-Fuller Test:')
-    print('Null Hypothesis: Unit Root Present (NON-STATIONARY)')
-    print('Test Statistic < Critical Value => Reject Null')
-    print('P-Value =< Alpha(.05) => Reject Null\n')
+    if verbose:
+        logger.info('Results of Augmented Dickey-Fuller Test:')
+        logger.info('Null Hypothesis: Unit Root Present (NON-STATIONARY)')
+        logger.info('Test Statistic < Critical Value => Reject Null')
+        logger.info('P-Value =< Alpha(.05) => Reject Null\n')
+
+    values = _to_1d_array(timeseries)
+    if fast and (lags is None or numba is None):
+        fast = False
+        warnings.warn(
+            "The fast path needs numba and an explicit 'lags' value; "
+            "falling back to statsmodels.")
 
-    result = adfuller(timeseries.values, autolag=auto_lag)
-    print(f'ADF Statistic: {result[0]}')
-    p_value = result[1]
-    print(f'p-value: {p_value}')
+    if fast:
+        statistic = _adfuller_statistic(
+            values, lags, _get_design(len(values), lags))
+        p_value = mackinnonp(statistic, regression='c', N=1)
+        critical_values = {}
+    elif lags is not None:
+        result = adfuller(values, maxlag=lags, autolag=None)
+        statistic, p_value, critical_values = result[0], result[1], result[4]
+    else:
+        if len(values) > _LONG_SERIES_SIZE:
+            warnings.warn(
+                "Running the automatic lag search on a long timeseries is "
+                "slow; consider setting an explicit 'lags' value.")
+        result = adfuller(values, autolag=auto_lag)
+        statistic, p_value, critical_values = result[0], result[1], result[4]
+    if verbose:
+        logger.info(f'ADF Statistic: {statistic}')
+        logger.info(f'p-value: {p_value}')
 
-    for key, value in result[4].items():
-        print('Critial Values:')
-        print(f'   {key}, {value}')
+        for key, value in critical_values.items():
+            logger.info('Critial Values:')
+            logger.info(f'   {key}, {value}')
 
     if p_value <= 0.05:
-        print("Reject the null hypothesis (H0). "
-              "The data is STATIONARY.")
+        if verbose:
+            logger.info("Reject the null hypothesis (H0). "
+                        "The data is STATIONARY.")
         pass_test = True
     else:
-        print("Fail to reject the null hypothesis (H0). "
-              "The data is NON-STATIONARY.")
+        if verbose:
+            logger.info("Fail to reject the null hypothesis (H0). "
+                        "The data is NON-STATIONARY.")
         pass_test = False
 
     return pass_test
 
 
-def run_kpss_test(timeseries: pd.DataFrame, regression: str = 'c') -> bool:
+def _init_adfuller_worker() -> None:
+    """
+    Pin BLAS to a single thread in each worker process, so workers do not
+    oversubscribe the cores they share with each other.
+    """
+    for variable in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                     'MKL_NUM_THREADS'):
+        os.environ[variable] = '1'
+
+
+def _run_adfuller_worker(args: Tuple[np.ndarray, int]) -> Tuple[float, float]:
+    values, lags = args
+    result = adfuller(values, maxlag=lags, autolag=None)
+    return result[0], result[1]
+
+
+def run_adfuller_batch(
+        frames: List[pd.DataFrame], lags: int,
+        max_workers: int = None) -> List[Tuple[float, float]]:
+    """
+    Given a list of timeseries dataframes, this function runs the Augmented
+    Dickey-Fuller test on each of them in parallel with a process pool, one
+    series per task. The test regressions are compute-bound, so throughput
+    scales with the number of cores.
+
+    Args:
+        frames (List[pd.DataFrame]): timeseries dataframes to test.
+        lags (int): fixed lag length to use for every test. A fixed value
+            avoids the automatic lag search in each worker.
+        max_workers (optional, int): number of worker processes. Default it
+            is the number of cores.
+
+    Returns:
+        A list of (test statistic, p-value) tuples, one per input
+        timeseries, in the same order as "frames".
+
+    """
+    tasks = [(_to_1d_array(frame), lags) for frame in frames]
+    workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, len(tasks) // (4 * workers))
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_adfuller_worker) as executor:
+        results = executor.map(
+            _run_adfuller_worker, tasks, chunksize=chunk_size)
+
+    return list(results)
+
+
+def run_kpss_test(
+        timeseries: pd.DataFrame, regression: str = 'c',
+        verbose: bool = False) -> bool:
     """
     Given a timeseries dataframe, this function runs Kwiatkowski-Phillips-
     Schmidt-Shin (KPSS) test to determines if timeseries is stationary or
@@ -61,6 +226,9 @@ def run_kpss_test(timeseries: pd.DataFrame, regression: str = 'c') -> bool:
             it is stationary or not.
         regression (str): "regression" param from
             statsmodels.tsa.stattools.kpss function.
+        verbose (optional, bool): if True, log the test results. Logging is
+            off by default so the test stays quiet when it is called over
+            many series. Default value is False.
 
     Notes:
         Timeseries is stationary if KPSS test reject the null hypothesis (H0).
@@ -71,29 +239,34 @@ def run_kpss_test(timeseries: pd.DataFrame, regression: str = 'c') -> bool:
         True if timeseries is stationary, otherwise False.
 
     """
-    print('Results of KPSS Test:')
-    print('Null Hypothesis: Data is Stationary/Trend '
-          'Stationary (STATIONARY)')
-    print('Test Statistic > Critical Value => Reject Null')
-    print('P-Value =< Alpha(.05) => Reject Null\n')
-
-    kpss_test = kpss(timeseries, regression=regression, nlags="auto")
-    index = [
-        'Test Statistic', 'p-value', 'Lags Used'
-    ]
-    kpss_output = pd.Series(kpss_test[0:3], index=index)
-    for key, value in kpss_test[3].items():
-        kpss_output[f'Critical Value {key}'] = value
-    print(kpss_output)
-
-    p_value = kpss_output[1]
+    if verbose:
+        logger.info('Results of KPSS Test:')
+        logger.info('Null Hypothesis: Data is Stationary/Trend '
+                    'Stationary (STATIONARY)')
+        logger.info('Test Statistic > Critical Value => Reject Null')
+        logger.info('P-Value =< Alpha(.05) => Reject Null\n')
+
+    kpss_test = kpss(
+        _to_1d_array(timeseries), regression=regression, nlags="auto")
+    p_value = kpss_test[1]
+    if verbose:
+        kpss_output = pd.Series({
+            'Test Statistic': kpss_test[0],
+            'p-value': p_value,
+            'Lags Used': kpss_test[2],
+            **{f'Critical Value {key}': value
+               for key, value in kpss_test[3].items()}
+        })
+        logger.info(kpss_output)
     if p_value <= 0.05:
-        print("Reject the null hypothesis (H0). "
-              "The data is NON-STATIONARY.")
+        if verbose:
+            logger.info("Reject the null hypothesis (H0). "
+                        "The data is NON-STATIONARY.")
         pass_test = False
     else:
-        print("Fail to reject the null hypothesis (H0). "
-              "The data is STATIONARY.")
+        if verbose:
+            logger.info("Fail to reject the null hypothesis (H0). "
+                        "The data is STATIONARY.")
         pass_test = True
 
     return pass_test
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -24,25 +25,14 @@ def create_pie_chart_with_grouped_threshold(
         start_angle (optional, int): start angle of Pie chart.
 
     """
-    grouped_df = input_df \
-        .groupby(column_name) \
-        .size() \
-        .to_frame() \
-        .reset_index() \
-        .rename(columns={0: 'sizes'})
+    sizes = input_df[column_name].value_counts(normalize=True, sort=False)
 
-    if not grouped_df.empty:
-        grouped_df['perc'] = grouped_df.sizes / grouped_df.sizes.sum()
+    if not sizes.empty:
+        labels_cleaned = np.where(
+            sizes.values < threshold, grouped_label, sizes.index)
 
-        cond_lt_threshold = grouped_df.perc < threshold
-        grouped_df.loc[cond_lt_threshold, 'label_cleaned'] = grouped_label
-        grouped_df['label_cleaned'] = grouped_df \
-            .label_cleaned \
-            .fillna(grouped_df[column_name])
-
-        grouped_df \
-            .groupby('label_cleaned') \
-            .sizes \
+        sizes \
+            .groupby(labels_cleaned, sort=False) \
             .sum() \
             .sort_values() \
             .plot(kind='pie', autopct='%1.1f%%', title=title, ax=ax,